@@ -1,115 +1,299 @@
+import atexit
+import hashlib
+import hmac
 import json
-from abc import ABC, abstractmethod
+import pickle
+import queue
+import tempfile
+import threading
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Iterator
+from urllib.parse import quote
 import streamlit as st
 import os  # Import os for file path handling
 
+try:
+    import orjson  # Optional: C/SIMD JSON codec, much faster than the stdlib json module
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack  # Optional: compact binary storage format
+except ImportError:
+    msgpack = None
+
+try:
+    import numpy as np  # Optional: vectorized XP stage lookup when loading many skills
+except ImportError:
+    np = None
+
+try:
+    import ijson  # Optional: incremental JSON parser, keeps large loads from materializing the whole file
+except ImportError:
+    ijson = None
 
-# --- Core Skill Classes ---
 
-class Skill(ABC):
+# --- Serialization Helpers ---
+
+def _json_dumps(data, pretty: bool = False) -> bytes:
     """
-    Abstract base class for all skills.
-    Defines common attributes and an abstract method for visual representation.
+    Encodes data as UTF-8 JSON bytes, using orjson when it is installed.
+    Output is compact unless pretty is set (handy for inspecting the file by hand).
     """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=4, ensure_ascii=False).encode("utf-8")
+    # ensure_ascii=False writes non-ASCII text as-is instead of \uXXXX escapes
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
-    def __init__(self, name: str, level: int = 0, description: str = ""):
-        if not (0 <= level <= 100):
-            raise ValueError("Skill level must be between 0 and 100.")
-        self.name = name
-        self.level = level
-        self.description = description
 
-    def update_level(self, new_level: int):
-        """Updates the skill level, ensuring it's within bounds."""
-        if not (0 <= new_level <= 100):
-            raise ValueError("New skill level must be between 0 and 100.")
-        self.level = new_level
-        st.info(f"Updated '{self.name}' level to {self.level}")
+def _json_loads(buf: bytes):
+    """Decodes JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(buf)  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    return json.loads(buf)
 
-    @abstractmethod
-    def get_visual_metaphor(self) -> str:
-        """
-        Abstract method to return a string representation of the visual metaphor.
-        This would be rendered graphically in a real GUI.
-        """
-        pass
 
-    def to_dict(self) -> dict:
-        """Converts the skill object to a dictionary for serialization."""
-        return {
-            "name": self.name,
-            "level": self.level,
-            "description": self.description,
-            "type": self.__class__.__name__  # Store the class name to reconstruct later
-        }
+def _encode(data, data_format: str, pretty: bool = False) -> bytes:
+    """Encodes data in the given storage format ("json", "msgpack" or "pickle")."""
+    if data_format == "json":
+        return _json_dumps(data, pretty)
+    if data_format == "msgpack":
+        if msgpack is None:
+            raise ValueError("The 'msgpack' format requires the msgpack package to be installed.")
+        return msgpack.packb(data, use_bin_type=True)
+    if data_format == "pickle":
+        return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    raise ValueError(f"Unknown data format '{data_format}'.")
 
 
-class SoftSkill(Skill):
+# The process umask, for giving new data files the mode a plain open() would (it can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# File suffix for each storage format, so a data file's name says what it holds
+_FORMAT_SUFFIXES = {"json": ".json", "msgpack": ".msgpack", "pickle": ".pickle"}
+
+
+def _decode(buf: bytes, allow_pickle: bool = False):
     """
-    Represents a soft skill with a 'mana bar' metaphor.
-    Mana bar value is directly proportional to the skill level.
+    Decodes data written by _encode(), sniffing the format from the leading bytes.
+    Unpickling runs arbitrary code, so pickled data is rejected unless allow_pickle is set.
     """
+    if buf.lstrip()[:1] == b"{":  # JSON, including legacy indented files
+        return _json_loads(buf)
+    if buf[:1] == b"\x80" and len(buf) > 1:  # Pickle PROTO opcode (a bare 0x80 is an empty msgpack map)
+        if not allow_pickle:
+            raise ValueError("Data file is pickled, but the 'pickle' format is not enabled.")
+        return pickle.loads(buf)
+    if msgpack is None:
+        raise ValueError("Data file looks like msgpack, but the msgpack package is not installed.")
+    return msgpack.unpackb(buf, raw=False)
 
-    def __init__(self, name: str, level: int = 0, description: str = ""):
-        super().__init__(name, level, description)
-        self._mana_bar_value = self._calculate_mana_bar()
 
-    def _calculate_mana_bar(self) -> int:
-        """Calculates the mana bar value (0-100) based on level."""
-        return self.level
+def _read_data_file(path: str, allow_pickle: bool = False):
+    """Reads and decodes a data file (see _decode())."""
+    with open(path, 'rb') as f:
+        return _decode(f.read(), allow_pickle)
 
-    def update_level(self, new_level: int):
-        """Updates level and recalculates mana bar."""
-        super().update_level(new_level)
-        self._mana_bar_value = self._calculate_mana_bar()
 
-    def get_visual_metaphor(self) -> str:
-        """Returns a string representation of the mana bar."""
-        filled_blocks = int(self._mana_bar_value / 10)  # 10 blocks for 100%
-        empty_blocks = 10 - filled_blocks
-        return f"Mana: [{'█' * filled_blocks}{'░' * empty_blocks}] ({self._mana_bar_value}%)"
+def _iter_skills_file(path: str, allow_pickle: bool = False):
+    """
+    Yields (category name, category data) pairs from a data file.
+    JSON files are stream-parsed with ijson when it is installed, so only one
+    category is held in raw form at a time; otherwise the whole file is decoded.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            is_json = f.read(64).lstrip()[:1] == b"{"
+            if is_json:
+                f.seek(0)
+                try:
+                    yield from ijson.kvitems(f, "")
+                except ijson.JSONError as e:
+                    raise ValueError(f"Invalid JSON: {e}") from e
+                return
+    yield from _read_data_file(path, allow_pickle).items()
+
+
+# --- Visual Metaphor Rendering ---
+
+# XP tree stages for hard skills, keyed by the minimum level of each stage
+XP_STAGES = {
+    0: "Seed",
+    10: "Sapling",
+    30: "Young Tree",
+    60: "Mature Tree",
+    90: "Ancient Tree"
+}
+# Thresholds and stage names in ascending order, precomputed once for bisect lookups
+_XP_THRESH = tuple(sorted(XP_STAGES))
+_XP_NAMES = tuple(stage_name for _, stage_name in sorted(XP_STAGES.items()))
+
+_XP_THRESH_ARRAY = np.asarray(_XP_THRESH) if np is not None else None
+
+# The mana bar has 10 blocks, so only 11 distinct bars exist
+_BARS = tuple('█' * filled + '░' * (10 - filled) for filled in range(11))
+
+
+def _stage_for_level(level: int) -> str:
+    """Maps a level to its XP tree stage name."""
+    i = bisect_right(_XP_THRESH, level) - 1
+    return _XP_NAMES[i] if i >= 0 else "Unknown"
+
+
+# Below this many levels, building the numpy arrays costs more than bisecting each level
+_NUMPY_MIN_LEVELS = 256
+
+
+def _stages_for_levels(levels: list[int]) -> list[str]:
+    """Maps many levels to XP tree stage names at once, in a single numpy call when available."""
+    if np is None or len(levels) < _NUMPY_MIN_LEVELS:
+        return [_stage_for_level(level) for level in levels]
+    stage_idx = np.searchsorted(_XP_THRESH_ARRAY, np.fromiter(levels, dtype=np.int32, count=len(levels)),
+                                side="right") - 1
+    return [_XP_NAMES[i] if i >= 0 else "Unknown" for i in stage_idx.tolist()]
+
+
+@lru_cache(maxsize=256)
+def _mana_bar_str(level: int) -> str:
+    """Renders the mana bar text for a level (cached, levels are 0-100)."""
+    filled_blocks = min(max(int(level / 10), 0), 10)  # 10 blocks for 100%
+    return f"Mana: [{_BARS[filled_blocks]}] ({level}%)"
 
 
-class HardSkill(Skill):
+@lru_cache(maxsize=256)
+def _xp_tree_str(level: int, stage: str) -> str:
+    """Renders the XP tree text for a level and its stage name (cached)."""
+    return f"XP Tree: {stage} (Level: {level})"
+
+
+def _xp_tree_for_level(level: int) -> str:
+    """Renders the XP tree text for a level."""
+    return _xp_tree_str(level, _stage_for_level(level))
+
+
+@lru_cache(maxsize=256)
+def _mana_label_str(level: int) -> str:
+    """Renders the progress bar label of a mana bar (cached)."""
+    return f"Mana: {level}%"
+
+
+@lru_cache(maxsize=256)
+def _xp_label_str(level: int, stage: str) -> str:
+    """Renders the progress bar label of an XP tree for a level and its stage name (cached)."""
+    return f"XP Progress: {level}% ({stage})"
+
+
+def _xp_label_for_level(level: int) -> str:
+    """Renders the progress bar label of an XP tree for a level."""
+    return _xp_label_str(level, _stage_for_level(level))
+
+
+# --- Core Skill Classes ---
+
+# Skill kinds, as stored in the "type" field of saved data, and their visual metaphor renderers
+SOFT_SKILL = "SoftSkill"  # Mana bar, directly proportional to the level
+HARD_SKILL = "HardSkill"  # XP tree, grown in stages based on the level
+_RENDERERS: dict[str, Callable[[int], str]] = {
+    SOFT_SKILL: _mana_bar_str,
+    HARD_SKILL: _xp_tree_for_level,
+}
+# Progress bar labels, by skill kind
+_LABELERS: dict[str, Callable[[int], str]] = {
+    SOFT_SKILL: _mana_label_str,
+    HARD_SKILL: _xp_label_for_level,
+}
+
+
+@dataclass(slots=True)
+class Skill:
     """
-    Represents a hard skill with an 'XP tree' metaphor.
-    XP tree progress is represented by 'stages' based on level.
+    A single skill. The kind picks the visual metaphor it is rendered with;
+    use make_soft() / make_hard() to create one of a given kind.
     """
-    XP_STAGES = {
-        0: "Seed",
-        10: "Sapling",
-        30: "Young Tree",
-        60: "Mature Tree",
-        90: "Ancient Tree"
-    }
-
-    def __init__(self, name: str, level: int = 0, description: str = ""):
-        super().__init__(name, level, description)
-        self._xp_tree_stage = self._calculate_xp_tree_stage()
-
-    def _calculate_xp_tree_stage(self) -> str:
-        """Determines the XP tree stage based on level."""
-        current_stage = "Unknown"
-        sorted_stages = sorted(self.XP_STAGES.items())
-        for threshold, stage_name in sorted_stages:
-            if self.level >= threshold:
-                current_stage = stage_name
-            else:
-                break  # Levels are sorted, so we can stop
-        return current_stage
-
-    def update_level(self, new_level: int):
-        """Updates level and recalculates XP tree stage."""
-        super().update_level(new_level)
-        self._xp_tree_stage = self._calculate_xp_tree_stage()
+    name: str
+    level: int = 0
+    description: str = ""
+    kind: str = SOFT_SKILL
+    render: Callable[[int], str] = field(init=False, repr=False, compare=False)
+    # Precomputed when the skill is built, so rendering doesn't redo it on every rerun
+    _progress: float = field(init=False, repr=False, compare=False)
+    _metaphor: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not (0 <= self.level <= 100):
+            raise ValueError("Skill level must be between 0 and 100.")
+        if self.kind not in _RENDERERS:
+            raise ValueError(f"Unknown skill type '{self.kind}'.")
+        self.render = _RENDERERS[self.kind]
+        self._refresh_render_cache()
+
+    def _refresh_render_cache(self):
+        """Precomputes what rendering needs, so it happens once rather than per rerun."""
+        self._progress = self.level / 100.0
+        self._metaphor = self.render(self.level)
+
+    @classmethod
+    def _from_dict_fast(cls, skill_data: dict) -> "Skill":
+        """
+        Rebuilds a skill from trusted data with "name", "level", "description" and "type" keys.
+        Bypasses __init__, so the level is not re-validated.
+        """
+        skill = cls.__new__(cls)
+        skill.name = skill_data["name"]
+        skill.level = skill_data.get("level", 0)
+        skill.description = skill_data.get("description", "")
+        skill.kind = skill_data["type"]
+        skill.render = _RENDERERS[skill.kind]
+        skill._refresh_render_cache()
+        return skill
 
     def get_visual_metaphor(self) -> str:
-        """Returns a string representation of the XP tree stage."""
-        return f"XP Tree: {self._xp_tree_stage} (Level: {self.level})"
+        """
+        Returns a string representation of the visual metaphor.
+        This would be rendered graphically in a real GUI.
+        """
+        return self._metaphor
+
+
+def make_soft(name: str, level: int = 0, description: str = "") -> Skill:
+    """Creates a soft skill, shown as a 'mana bar' filled in proportion to its level."""
+    return Skill(name, level, description, SOFT_SKILL)
+
+
+def make_hard(name: str, level: int = 0, description: str = "") -> Skill:
+    """Creates a hard skill, shown as an 'XP tree' whose stage depends on its level."""
+    return Skill(name, level, description, HARD_SKILL)
+
+
+# Skill kinds by type code, as stored in SkillCategory's type column
+_SKILL_KINDS = (SOFT_SKILL, HARD_SKILL)
+_SKILL_TYPE_CODES = {kind: code for code, kind in enumerate(_SKILL_KINDS)}
 
 
 # --- Skill Category Management ---
 
+def _render_category(name: str, skills_snapshot: tuple):
+    """
+    Renders one category from a snapshot of
+    (name, level, description, visual metaphor, progress, progress label) tuples.
+    """
+    st.subheader(f"Category: {name}")
+    if not skills_snapshot:
+        st.write("No skills in this category yet.")
+        return
+    for skill_name, level, description, metaphor, progress, label in skills_snapshot:
+        st.markdown(f"**{skill_name}** (Level: {level})")
+        st.write(f"Description: {description}")
+        st.write(metaphor)
+        st.progress(progress, text=label)
+
+
 class SkillCategory:
     """
     Manages a collection of skills within a specific category.
@@ -118,53 +302,165 @@ class SkillCategory:
 
     def __init__(self, name: str):
         self.name = name
-        self.skills: dict[str, Skill] = {}  # Store skills by name for easy lookup
+        # Skills are stored column-wise: row i of every column describes one skill
+        self._index: dict[str, int] = {}  # Skill name -> row, for easy lookup
+        self._names: list[str] = []
+        self._levels = array('i')
+        self._descs: list[str] = []
+        self._types = array('b')  # Type codes, see _SKILL_KINDS
+        # Render values, precomputed whenever a level changes rather than on every rerun
+        self._progress = array('d')
+        self._metaphors: list[str] = []
+        self._labels: list[str] = []  # Progress bar labels
+        self._skill_names_cache: tuple[str, ...] | None = None  # Rebuilt lazily after adds/removes
+
+    def _columns(self) -> tuple:
+        """Returns every per-skill column, in a fixed order."""
+        return (self._names, self._levels, self._descs, self._types,
+                self._progress, self._metaphors, self._labels)
+
+    def skill_names(self) -> tuple[str, ...]:
+        """Returns the names of all skills in this category."""
+        if self._skill_names_cache is None:
+            self._skill_names_cache = tuple(self._names)
+        return self._skill_names_cache
+
+    def _set_skill(self, name: str, level: int, description: str, type_code: int):
+        """Writes a skill row, replacing any existing skill with the same name."""
+        kind = _SKILL_KINDS[type_code]
+        self._set_row((name, level, description, type_code,
+                       level / 100.0, _RENDERERS[kind](level), _LABELERS[kind](level)))
+
+    def _set_skills_bulk(self, names: list[str], levels: list[int], descriptions: list[str],
+                         type_codes: list[int], hard_stages: Iterator[str]):
+        """
+        Writes many skill rows at once, as on load. The XP stages of hard skills are taken
+        in order from hard_stages, resolved up front for everything being loaded
+        (see _stages_for_levels()) instead of one lookup per skill.
+        """
+        for name, level, description, code in zip(names, levels, descriptions, type_codes):
+            kind = _SKILL_KINDS[code]
+            if kind == HARD_SKILL:
+                stage = next(hard_stages)
+                metaphor, label = _xp_tree_str(level, stage), _xp_label_str(level, stage)
+            else:
+                metaphor, label = _RENDERERS[kind](level), _LABELERS[kind](level)
+            self._set_row((name, level, description, code, level / 100.0, metaphor, label))
+
+    def _set_row(self, row: tuple):
+        """Writes a full row (one value per column, see _columns()), replacing any row with the same name."""
+        name = row[0]
+        i = self._index.get(name)
+        if i is None:
+            self._index[name] = len(self._names)
+            for column, value in zip(self._columns(), row):
+                column.append(value)
+            self._skill_names_cache = None
+        else:
+            for column, value in zip(self._columns(), row):
+                column[i] = value
 
     def add_skill(self, skill: Skill):
         """Adds a skill to the category."""
-        if skill.name in self.skills:
-            st.warning(f"Warning: Skill '{skill.name}' already exists in category '{self.name}'.")
-        self.skills[skill.name] = skill
-        st.success(f"Added skill '{skill.name}' to category '{self.name}'.")
+        ok, msg = self._add_skill_silent(skill)
+        if ok:
+            st.success(msg)
+        else:
+            st.warning(msg)
+
+    def _add_skill_silent(self, skill: Skill) -> tuple[bool, str]:
+        """
+        Like add_skill(), but returns (ok, message) instead of rendering it.
+        An existing skill with the same name is replaced, and reported with ok=False.
+        """
+        replaced = skill.name in self._index
+        self._set_skill(skill.name, skill.level, skill.description, _SKILL_TYPE_CODES[skill.kind])
+        if replaced:
+            return False, f"Warning: Skill '{skill.name}' already exists in category '{self.name}'. Replaced it."
+        return True, f"Added skill '{skill.name}' to category '{self.name}'."
 
     def get_skill(self, skill_name: str) -> Skill | None:
-        """Retrieves a skill by name."""
-        return self.skills.get(skill_name)
+        """
+        Retrieves a skill by name, materialized from the stored columns.
+        The returned object is a copy; use update_skill_level() to change the stored level.
+        """
+        i = self._index.get(skill_name)
+        if i is None:
+            return None
+        return Skill._from_dict_fast({"name": skill_name, "level": self._levels[i],
+                                      "description": self._descs[i], "type": _SKILL_KINDS[self._types[i]]})
+
+    def update_skill_level(self, skill_name: str, new_level: int):
+        """Updates the stored level of a skill, ensuring it's within bounds."""
+        ok, msg = self._update_level_silent(skill_name, new_level)
+        if ok:
+            st.info(msg)
+        else:
+            st.error(msg)
+
+    def _update_level_silent(self, skill_name: str, new_level: int) -> tuple[bool, str]:
+        """Like update_skill_level(), but returns (ok, message) instead of rendering it."""
+        i = self._index.get(skill_name)
+        if i is None:
+            return False, f"Error: Skill '{skill_name}' not found in category '{self.name}'."
+        if not (0 <= new_level <= 100):
+            return False, f"Error: New level for '{skill_name}' must be between 0 and 100, got {new_level}."
+        self._levels[i] = new_level
+        self._progress[i] = new_level / 100.0
+        kind = _SKILL_KINDS[self._types[i]]
+        self._metaphors[i] = _RENDERERS[kind](new_level)
+        self._labels[i] = _LABELERS[kind](new_level)
+        return True, f"Updated '{skill_name}' level to {new_level}"
 
     def remove_skill(self, skill_name: str):
         """Removes a skill from the category."""
-        if skill_name in self.skills:
-            del self.skills[skill_name]
-            st.success(f"Removed skill '{skill_name}' from category '{self.name}'.")
+        ok, msg = self._remove_skill_silent(skill_name)
+        if ok:
+            st.success(msg)
         else:
-            st.error(f"Error: Skill '{skill_name}' not found in category '{self.name}'.")
+            st.error(msg)
+
+    def _remove_skill_silent(self, skill_name: str) -> tuple[bool, str]:
+        """Like remove_skill(), but returns (ok, message) instead of rendering it."""
+        i = self._index.pop(skill_name, None)
+        if i is None:
+            return False, f"Error: Skill '{skill_name}' not found in category '{self.name}'."
+        # Swap the last row into the freed slot so removal is O(1); the last skill takes the removed one's place
+        last = len(self._names) - 1
+        for column in self._columns():
+            if i != last:
+                column[i] = column[last]
+            column.pop()
+        if i != last:
+            self._index[self._names[i]] = i
+        self._skill_names_cache = None
+        return True, f"Removed skill '{skill_name}' from category '{self.name}'."
 
     def display_category_skills(self):
         """Displays all skills within this category."""
-        st.subheader(f"Category: {self.name}")
-        if not self.skills:
-            st.write("No skills in this category yet.")
-            return
-        for skill_name, skill in self.skills.items():
-            st.markdown(f"**{skill.name}** (Level: {skill.level})")
-            st.write(f"Description: {skill.description}")
-            st.write(skill.get_visual_metaphor())
-            if isinstance(skill, SoftSkill):
-                st.progress(skill.level / 100.0, text=f"Mana: {skill.level}%")
-            elif isinstance(skill, HardSkill):
-                # For XP tree, a simple progress bar can represent the level
-                st.progress(skill.level / 100.0, text=f"XP Progress: {skill.level}% ({skill._xp_tree_stage})")
-
-    def to_dict(self) -> dict:
-        """Converts the category and its skills to a dictionary for serialization."""
-        return {
-            "name": self.name,
-            "skills": [skill.to_dict() for skill in self.skills.values()]
-        }
+        _render_category(self.name, self._snapshot())
+
+    def _snapshot(self) -> tuple:
+        """Returns the render snapshot of this category (see _render_category())."""
+        return tuple(
+            (name, level, description, metaphor, progress, label)
+            for name, level, description, _, progress, metaphor, label in zip(*self._columns())
+        )
+
+    def _rows(self) -> list[tuple]:
+        """Returns one (name, level, description, type code) tuple per skill, read straight off the columns."""
+        return list(zip(self._names, self._levels, self._descs, self._types))
 
 
 # --- Platform Manager ---
 
+# Version of the row-based layout written by save_data() and _serialize()
+_DATA_VERSION = 1
+# Bump when the layout of _serialize() changes, so caches written by older code are ignored
+_CACHE_VERSION = 2
+# What reading a missing, malformed or foreign data file can raise
+_LOAD_ERRORS = (OSError, KeyError, TypeError, ValueError, pickle.UnpicklingError)
+
 class SkillPlatformManager:
     """
     Manages all skill categories and provides overall platform functionalities.
@@ -172,79 +468,504 @@ class SkillPlatformManager:
 
     def __init__(self):
         self.categories: dict[str, SkillCategory] = {}  # Store categories by name
-        self.data_filename = "skills_data.json"  # Define default filename
+        # The manager is shared by every session's script thread: hold this lock while changing
+        # categories or their skills, and while reading them for a save
+        self.lock = threading.RLock()
+        self._category_names_cache: tuple[str, ...] | None = None  # Rebuilt lazily after adds/removes
+        self.data_filename = "skills_data.json"  # Legacy single-file store, imported if no data dir exists
+        self._data_dir = "skills_data"  # One file per category, plus index.json listing them in order
+        self._category_files: dict[str, str] = {}  # Category name -> its file in the data dir, as last written
+        # Categories whose files failed to load (name -> file); kept in the index so saves don't orphan them
+        self._unloaded: dict[str, str] = {}
+        # Signed pickle of the serialized categories for fast startup; rebuildable, the data dir stays authoritative
+        self._cache_filename = "skills_data.pkl"
+        self._cache_key_filename = ".skills_cache_key"  # Used unless SKILLS_CACHE_KEY is set
+        self._cache_stale = False  # Set when the cache no longer matches the data, written on close()
+        # Storage format for saving: "json", "msgpack" or "pickle"; pickled files are only loaded
+        # when this is "pickle", since unpickling an untrusted file can run arbitrary code
+        self.data_format = "json"
+        self.durable = True  # fsync each written file (and its directory) before relying on it
+        self._dirty_cats: set[str] = set()  # Categories changed since the last save
+        self._index_dirty = False  # Set when categories are added or removed
+        self._full_resave = False  # Set after a failed write, so the next save rewrites every file
+        self.loaded = False  # Set once load_data() has succeeded; until then each run retries it
+        self._load_error: str | None = None  # Why the last load_data() failed; saves are refused meanwhile
+        # Pending file writes for the background writer (path -> bytes, or None to delete);
+        # a newer batch is merged into one the writer hasn't picked up yet
+        self._write_queue: queue.Queue[dict[str, bytes | None]] = queue.Queue(maxsize=1)
+        self._write_lock = threading.Lock()  # Serializes producers (the manager is shared across sessions)
+        self._writer: threading.Thread | None = None  # Started on the first save
+        self._write_error: OSError | None = None  # Last failure seen by the writer, see report_write_error()
+        atexit.register(self.close)  # Don't lose unsaved edits on shutdown
 
     def add_category(self, category_name: str):
         """Adds a new skill category."""
-        if category_name in self.categories:
-            st.warning(f"Warning: Category '{category_name}' already exists.")
-            return
-        self.categories[category_name] = SkillCategory(category_name)
-        st.success(f"Category '{category_name}' added.")
-        self.save_data()  # Save data after adding category
+        ok, msg = self._add_category_silent(category_name)
+        if ok:
+            st.success(msg)
+        else:
+            st.warning(msg)
+
+    def _add_category_silent(self, category_name: str) -> tuple[bool, str]:
+        """Like add_category(), but returns (ok, message) instead of rendering it."""
+        with self.lock:
+            if category_name in self.categories:
+                return False, f"Warning: Category '{category_name}' already exists."
+            if category_name in self._unloaded:
+                return False, (f"Warning: Category '{category_name}' already exists but couldn't be loaded. "
+                               f"Fix its file ({self._unloaded[category_name]}) and restart.")
+            self.categories[category_name] = SkillCategory(category_name)
+            self._category_names_cache = None
+            self._dirty_cats.add(category_name)
+            self._index_dirty = True
+        return True, f"Category '{category_name}' added."
 
     def get_category(self, category_name: str) -> SkillCategory | None:
         """Retrieves a skill category by name."""
         return self.categories.get(category_name)
 
+    def category_names(self) -> tuple[str, ...]:
+        """Returns the names of all categories, in insertion order."""
+        if self._category_names_cache is None:
+            self._category_names_cache = tuple(self.categories)
+        return self._category_names_cache
+
     def remove_category(self, category_name: str):
         """Removes a skill category."""
-        if category_name in self.categories:
-            del self.categories[category_name]
-            st.success(f"Category '{category_name}' removed.")
-            self.save_data()  # Save data after removing category
+        ok, msg = self._remove_category_silent(category_name)
+        if ok:
+            st.success(msg)
         else:
-            st.error(f"Error: Category '{category_name}' not found.")
+            st.error(msg)
+
+    def _remove_category_silent(self, category_name: str) -> tuple[bool, str]:
+        """Like remove_category(), but returns (ok, message) instead of rendering it."""
+        with self.lock:
+            if category_name not in self.categories:
+                return False, f"Error: Category '{category_name}' not found."
+            del self.categories[category_name]
+            self._category_names_cache = None
+            self._dirty_cats.add(category_name)  # Saving a category that no longer exists deletes its file
+            self._index_dirty = True
+        return True, f"Category '{category_name}' removed."
 
     def display_all_skills(self):
         """Displays all skills across all categories."""
-        if not self.categories:
+        with self.lock:  # Snapshot under the lock, render outside it
+            snapshots = [(category.name, category._snapshot()) for category in self.categories.values()]
+        if not snapshots:
             st.info("No skill categories defined yet.")
             return
         st.header("All Skills Overview")
-        for category in self.categories.values():
-            category.display_category_skills()
+        for name, skills_snapshot in snapshots:
+            _render_category(name, skills_snapshot)
             st.markdown("---")  # Separator between categories
 
-    # --- Persistence (Simplified to JSON) ---
-    def save_data(self):
-        """Saves all skill data to a JSON file."""
-        data = {name: category.to_dict() for name, category in self.categories.items()}
+    # --- Persistence (JSON by default, msgpack/pickle optional) ---
+    def mark_dirty(self, category_name: str):
+        """Flags a category as changed so the next flush() writes its file."""
+        with self.lock:
+            self._dirty_cats.add(category_name)
+
+    def flush(self):
+        """Writes skill data to disk only if something changed since the last save."""
+        with self.lock:
+            if self._dirty_cats or self._index_dirty or self._full_resave:
+                self.save_data()
+
+    def close(self):
+        """
+        Flushes pending changes, waits until the background writer has written them,
+        and refreshes the startup cache.
+        """
+        self.flush()
+        self._write_queue.join()
+        if self._write_error is not None or self._full_resave:
+            # The data files are behind memory, so a cache written now would be trusted over them
+            # on the next startup; drop it instead and let that startup read the data files
+            try:
+                os.remove(self._cache_filename)
+            except OSError:
+                pass  # Already gone
+        elif self._cache_stale and not self._unloaded and os.path.isdir(self._data_dir):
+            # Skipped while categories are unloaded: the cache would make the next startup skip them too
+            self._write_cache()
+
+    def _category_file(self, category_name: str) -> str:
+        """
+        Returns the file name for a category in the configured format. The name is escaped and
+        truncated so any category name gives a valid filename, and suffixed with a hash of the full
+        name so that names differing only in case or past the cut get their own file, and no
+        category can map to index.json.
+        """
+        digest = hashlib.sha256(category_name.encode("utf-8")).hexdigest()[:16]
+        return f"{quote(category_name, safe='')[:64]}-{digest}{_FORMAT_SUFFIXES[self.data_format]}"
+
+    def _index_path(self) -> str:
+        """Returns the index file, which lists the categories in order."""
+        return os.path.join(self._data_dir, "index.json")
+
+    def save_data(self, pretty: bool = False):
+        """
+        Saves changed categories, one file each, in the configured format.
+        Set pretty=True to write indented JSON for debugging.
+        Files are encoded here and written to disk by a background thread.
+        """
+        self.report_write_error()
+        with self.lock:
+            ok, msg = self._save_data_silent(pretty)
+        if ok:
+            st.success(msg)
+        else:
+            st.error(msg)
+
+    def _save_data_silent(self, pretty: bool = False) -> tuple[bool, str]:
+        """Like save_data(), but returns (ok, message) instead of rendering it. Call with self.lock held."""
+        if self._load_error is not None:
+            # Writing now would replace the index with only what's in memory
+            return False, f"Error saving data: not saved because the data failed to load ({self._load_error})."
+        if self._full_resave:
+            self._full_resave = False
+            self._dirty_cats.update(self.categories)
+            self._index_dirty = True
+        dirty_cats, self._dirty_cats = self._dirty_cats, set()
+        index_dirty, self._index_dirty = self._index_dirty, False
+        batch: dict[str, bytes | None] = {}
+        category_files = dict(self._category_files)  # Committed only once the batch is queued
+        dirty_cats |= self.categories.keys() - category_files.keys()  # Every category listed needs a file
         try:
-            with open(self.data_filename, 'w') as f:
-                json.dump(data, f, indent=4)
-            st.success(f"Skill data saved to {self.data_filename}")
-        except IOError as e:
-            st.error(f"Error saving data: {e}")
+            for cat_name in dirty_cats:
+                category = self.categories.get(cat_name)
+                old_file = category_files.pop(cat_name, None)
+                if category is None:
+                    # A dirty category that no longer exists was removed, so its file is deleted
+                    if old_file is not None:
+                        batch[os.path.join(self._data_dir, old_file)] = None
+                    continue
+                cat_data = {"v": _DATA_VERSION, "name": cat_name, "rows": category._rows()}
+                buf = _encode(cat_data, self.data_format, pretty)
+                new_file = category_files[cat_name] = self._category_file(cat_name)
+                batch[os.path.join(self._data_dir, new_file)] = buf
+                if old_file != new_file:  # New, or written in another format before
+                    if old_file is not None:
+                        batch[os.path.join(self._data_dir, old_file)] = None
+                    index_dirty = True
+            if index_dirty:
+                entries = [[cat_name, category_files[cat_name]] for cat_name in self.categories]
+                entries.extend([cat_name, file_name] for cat_name, file_name in self._unloaded.items())
+                index = {"v": _DATA_VERSION, "categories": entries}
+                batch[self._index_path()] = _json_dumps(index, pretty)
+        except ValueError as e:
+            self._dirty_cats |= dirty_cats
+            self._index_dirty |= index_dirty
+            return False, f"Error saving data: {e}"
+        self._category_files = category_files
+        self._enqueue_write(batch)
+        self._cache_stale = True
+        return True, f"Skill data queued for saving to {self._data_dir}"
+
+    def report_write_error(self):
+        """Shows the last error hit by the background writer, if any, once."""
+        error, self._write_error = self._write_error, None
+        if error is not None:
+            st.error(f"Error saving data: {error}. All categories will be written again on the next save.")
+
+    def _enqueue_write(self, batch: dict[str, bytes | None]):
+        """Hands file writes to the writer thread, merging them into any batch it hasn't picked up yet."""
+        with self._write_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._writer_loop, name="skills-writer", daemon=True)
+                self._writer.start()
+            try:
+                pending = self._write_queue.get_nowait()
+                self._write_queue.task_done()
+                pending.update(batch)  # Newer contents for the same file win
+                batch = pending
+            except queue.Empty:
+                pass  # Nothing pending, or the writer took it in the meantime
+            self._write_queue.put_nowait(batch)
+
+    def _writer_loop(self):
+        """Background thread: applies each queued batch of file writes."""
+        while True:
+            batch = self._write_queue.get()
+            try:
+                os.makedirs(self._data_dir, exist_ok=True)
+                # The index goes after the files it lists and before deletions of files it dropped,
+                # so it never names a missing file if the process dies part way through
+                index_buf = batch.pop(self._index_path(), None)
+                for path, buf in batch.items():
+                    if buf is not None:
+                        self._write_file(path, buf)
+                if index_buf is not None:
+                    self._write_file(self._index_path(), index_buf)
+                for path, buf in batch.items():
+                    if buf is None:
+                        try:
+                            os.remove(path)
+                        except FileNotFoundError:
+                            pass
+            except OSError as e:
+                self._write_error = e
+                self._full_resave = True
+            finally:
+                self._write_queue.task_done()
+
+    def _write_file(self, path: str, buf: bytes):
+        """
+        Writes bytes to a temp file in the same directory and swaps it in, so a crash
+        mid-write never truncates the target. With durable set, the data is fsynced
+        before the swap and the directory entry after it.
+        """
+        dirname = os.path.dirname(os.path.abspath(path))
+        fd, tmp_path = tempfile.mkstemp(dir=dirname, prefix=".skills_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                if os.name == "posix":
+                    # mkstemp creates the file owner-only; keep the target's mode, or use the umask default
+                    try:
+                        mode = os.stat(path).st_mode & 0o7777
+                    except FileNotFoundError:
+                        mode = 0o666 & ~_UMASK
+                    os.fchmod(f.fileno(), mode)
+                f.write(buf)
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        if self.durable and os.name == "posix":  # Directories can't be opened for fsync on Windows
+            dir_fd = os.open(dirname, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+    @staticmethod
+    def _columns_from_data(cat_name: str, cat_data: dict, skipped: list[str]) -> tuple[list, list, list, list]:
+        """
+        Returns the (names, levels, descriptions, type codes) columns of a category from its serialized
+        form: either the row-based layout written by save_data(), or the legacy "skills" list of
+        per-skill dicts with "name", "level", "description" and "type" keys.
+        Skills of unknown type are left out and their descriptions appended to skipped. A row layout
+        of another version raises ValueError, and load_data() leaves the whole category unloaded.
+        """
+        names, levels, descriptions, type_codes = [], [], [], []
+        if "rows" in cat_data:
+            if cat_data.get("v") != _DATA_VERSION:
+                raise ValueError(f"Unsupported data version {cat_data.get('v')!r} for category '{cat_name}'.")
+            for name, level, description, type_code in cat_data["rows"]:
+                if not (0 <= type_code < len(_SKILL_KINDS)):
+                    skipped.append(f"'{name}' (type code {type_code})")
+                    continue
+                names.append(name)
+                levels.append(int(level))
+                descriptions.append(description)
+                type_codes.append(type_code)
+        for skill_data in cat_data.get("skills", ()):
+            skill_type = skill_data["type"]  # Get the skill type
+            type_code = _SKILL_TYPE_CODES.get(skill_type)
+            if type_code is None:
+                skipped.append(f"'{skill_data['name']}' ({skill_type})")
+                continue
+            names.append(skill_data["name"])
+            levels.append(int(skill_data.get("level", 0)))  # The level column only holds ints
+            descriptions.append(skill_data.get("description", ""))
+            type_codes.append(type_code)
+        return names, levels, descriptions, type_codes
+
+    def _read_index(self) -> list[tuple[str, str]] | None:
+        """Returns the (category name, file name) pairs listed in the index, or None if there is no index."""
+        index_path = self._index_path()
+        if not os.path.exists(index_path):
+            return None
+        index = _read_data_file(index_path)
+        if not isinstance(index, dict) or index.get("v") != _DATA_VERSION:
+            raise ValueError(f"Unsupported index format in {index_path}.")
+        return [(cat_name, file_name) for cat_name, file_name in index["categories"]]
+
+    def _iter_data_dir(self, unreadable: dict[str, str]):
+        """
+        Yields (category name, category data) for each category in index order, decoding
+        one category file at a time so only one is held in raw form. Without an index
+        (the first save never finished), every category file found is loaded, in name order.
+        Files that can't be read are left out and the reason recorded in unreadable.
+        """
+        allow_pickle = self.data_format == "pickle"  # Only trust pickled files when configured to write them
+        entries = self._read_index()
+        if entries is None:
+            suffixes = tuple(_FORMAT_SUFFIXES.values())
+            with os.scandir(self._data_dir) as dir_entries:
+                file_names = sorted(entry.name for entry in dir_entries
+                                    if entry.is_file() and entry.name.endswith(suffixes)
+                                    and entry.name != os.path.basename(self._index_path()))
+            entries = [(None, file_name) for file_name in file_names]
+        # The index is authoritative; files it doesn't list are leftovers of removed categories
+        for cat_name, file_name in entries:
+            if cat_name is not None:
+                self._category_files[cat_name] = file_name
+            path = os.path.join(self._data_dir, file_name)
+            try:
+                cat_data = _read_data_file(path, allow_pickle)
+                if cat_name is None:
+                    cat_name = cat_data["name"]
+                    self._category_files[cat_name] = file_name
+                elif cat_data.get("name") != cat_name:
+                    raise ValueError(f"File holds category {cat_data.get('name')!r}, expected {cat_name!r}.")
+            except _LOAD_ERRORS as e:
+                unreadable[cat_name if cat_name is not None else file_name] = f"{path}: {e}"
+                continue
+            yield cat_name, cat_data
+
+    def _serialize(self) -> dict:
+        """
+        Flattens every category into a single list of (category, name, level, description, type code)
+        rows, read straight off the columns without building per-skill dicts.
+        The category list is kept alongside so empty categories and their order survive.
+        """
+        rows = []
+        with self.lock:
+            for cat_name, category in self.categories.items():
+                rows.extend((cat_name, *row) for row in category._rows())
+            return {"v": _DATA_VERSION, "categories": list(self.categories), "rows": rows}
+
+    @staticmethod
+    def _deserialize(data: dict):
+        """Reverses _serialize(): yields (category name, category data) pairs, grouping rows by category."""
+        grouped: dict[str, list] = {cat_name: [] for cat_name in data["categories"]}
+        for row in data["rows"]:
+            grouped[row[0]].append(row[1:])
+        for cat_name, rows in grouped.items():
+            yield cat_name, {"v": data["v"], "name": cat_name, "rows": rows}
+
+    # --- Startup Cache (signed pickle) ---
+    def _cache_key(self) -> bytes:
+        """Returns the HMAC key for the cache, creating a random key file on first use."""
+        key = os.environ.get("SKILLS_CACHE_KEY")
+        if key:
+            return key.encode("utf-8")
+        try:
+            with open(self._cache_key_filename, 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            key = os.urandom(32)
+            fd = os.open(self._cache_key_filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(key)
+            return key
+
+    def _data_mtime(self) -> float:
+        """Returns the newest modification time of the data directory and its files."""
+        mtime = os.path.getmtime(self._data_dir)
+        with os.scandir(self._data_dir) as entries:
+            for entry in entries:
+                mtime = max(mtime, entry.stat().st_mtime)
+        return mtime
+
+    def _write_cache(self):
+        """Writes the categories to the pickle cache, prefixed with an HMAC-SHA256 signature."""
+        # Plain rows rather than SkillCategory objects: Streamlit re-executes this script on every
+        # rerun, so the classes of long-lived objects are not the ones pickle would look up
+        payload = pickle.dumps((_CACHE_VERSION, self._serialize()), protocol=pickle.HIGHEST_PROTOCOL)
+        try:
+            signature = hmac.new(self._cache_key(), payload, hashlib.sha256).digest()
+            self._write_file(self._cache_filename, signature + payload)
+            self._cache_stale = False
+        except OSError:
+            pass  # The cache is only an optimization; the next startup reads the data dir instead
+
+    def _load_cache(self) -> dict | None:
+        """
+        Returns the cached category data, or None if the cache is missing, older than the data,
+        or fails the signature check (so a tampered file is never unpickled).
+        """
+        try:
+            if os.path.getmtime(self._cache_filename) < self._data_mtime():
+                return None
+            with open(self._cache_filename, 'rb') as f:
+                buf = f.read()
+            signature, payload = buf[:32], buf[32:]
+            expected = hmac.new(self._cache_key(), payload, hashlib.sha256).digest()
+            if not hmac.compare_digest(signature, expected):
+                return None
+            version, data = pickle.loads(payload)
+        except Exception:
+            return None  # Any problem just means falling back to the data dir
+        return data if version == _CACHE_VERSION else None
 
     def load_data(self):
-        """Loads skill data from a JSON file."""
-        if not os.path.exists(self.data_filename):
-            st.info(f"No data file found at {self.data_filename}. Starting fresh.")
+        """
+        Loads skill data from the data directory, or imports the legacy single data file.
+        A category that fails to load is reported and left out; the others still load.
+        If the data can't be loaded at all, loaded stays False and saving is refused
+        until a later call succeeds, so the files on disk are never overwritten.
+        """
+        unreadable: dict[str, str] = {}  # Category name -> why it couldn't be loaded
+        if os.path.isdir(self._data_dir):
+            cached = self._load_cache()
+            if cached is not None:
+                source, items = self._cache_filename, self._deserialize(cached)
+            else:
+                source, items = self._data_dir, self._iter_data_dir(unreadable)
+        elif os.path.exists(self.data_filename):
+            source, items = self.data_filename, _iter_skills_file(self.data_filename, self.data_format == "pickle")
+        else:
+            self.loaded, self._load_error = True, None
+            st.info(f"No data found at {self._data_dir}. Starting fresh.")
             return
         try:
-            with open(self.data_filename, 'r') as f:
-                data = json.load(f)
-            self.categories = {}  # Clear existing data
-            for cat_name, cat_data in data.items():
+            categories = {}  # Built aside so a failed load leaves existing data untouched
+            skipped: list[str] = []  # Reported once below, rather than one message per skill
+            loaded_columns = []
+            for cat_name, cat_data in items:
+                try:
+                    loaded_columns.append((cat_name, self._columns_from_data(cat_name, cat_data, skipped)))
+                except _LOAD_ERRORS as e:
+                    unreadable[cat_name] = str(e)
+            # Resolve the XP stages of every hard skill being loaded in one call
+            hard_code = _SKILL_TYPE_CODES[HARD_SKILL]
+            hard_stages = iter(_stages_for_levels([
+                level for _, (_, levels, _, type_codes) in loaded_columns
+                for level, type_code in zip(levels, type_codes) if type_code == hard_code
+            ]))
+            for cat_name, columns in loaded_columns:
+                # Write straight into the category's columns; no Skill objects are built on load
                 category = SkillCategory(cat_name)
-                for skill_data in cat_data["skills"]:
-                    skill_type = skill_data.pop("type")  # Get the skill type
-                    if skill_type == "SoftSkill":
-                        skill = SoftSkill(**skill_data)
-                    elif skill_type == "HardSkill":
-                        skill = HardSkill(**skill_data)
-                    else:
-                        st.warning(
-                            f"Warning: Unknown skill type '{skill_type}' for skill '{skill_data['name']}'. Skipping.")
-                        continue
-                    category.add_skill(skill)
-                self.categories[cat_name] = category
-            st.success(f"Skill data loaded from {self.data_filename}")
+                category._set_skills_bulk(*columns, hard_stages)
+                categories[cat_name] = category
+            if source == self._cache_filename:
+                self._category_files.update(self._read_index() or ())  # The cache holds no file names
+            # Unreadable categories keep their files and index entries until they load again
+            self._unloaded = {cat_name: file_name for cat_name, file_name in self._category_files.items()
+                              if cat_name not in categories}
+            self.categories = categories
+            self._category_names_cache = None
+            self.loaded, self._load_error = True, None
+            self._cache_stale = source != self._cache_filename  # Let the next startup skip parsing
+            if source == self.data_filename:
+                # Migrate: write every category to the data directory on the next save
+                self._dirty_cats.update(categories)
+                self._index_dirty = True
+            if skipped:
+                st.warning(f"Warning: Skipped {len(skipped)} skill(s) of unknown type: {', '.join(skipped)}.")
+            if unreadable:
+                details = "; ".join(f"'{cat_name}' ({reason})" for cat_name, reason in unreadable.items())
+                st.warning(f"Warning: Couldn't load {len(unreadable)} category(ies), their data is kept on disk "
+                           f"and loads again once fixed: {details}.")
+            st.success(f"Skill data loaded from {source}")
         except json.JSONDecodeError as e:
-            st.error(f"Error decoding JSON from {self.data_filename}: {e}")
+            self._load_error = f"Error decoding JSON from {source}: {e}"
+        except (pickle.UnpicklingError, KeyError, TypeError, ValueError) as e:  # A bad index or legacy file
+            self._load_error = f"Error decoding data from {source}: {e!r}"
         except IOError as e:
-            st.error(f"Error loading data: {e}")
+            self._load_error = f"Error loading data: {e}"
+        if self._load_error is not None:
+            st.error(f"{self._load_error}. Saving is disabled until the data loads.")
 
     # --- Placeholder for Export Functionality ---
     def export_as_pdf(self):
@@ -310,18 +1031,27 @@ class SkillPlatformManager:
 
 # --- Streamlit Application ---
 
+@st.cache_resource
+def get_manager() -> SkillPlatformManager:
+    """
+    Builds the platform manager once per server process and shares it across sessions.
+    Data is loaded by the first script run rather than in here, because Streamlit replays
+    any messages emitted inside a cached function on every rerun.
+    """
+    return SkillPlatformManager()
+
+
 def streamlit_app():
     st.set_page_config(layout="wide", page_title="Skill Management Platform")
 
     st.title("Skill Management Platform")
     st.markdown("Organize your skills with visual metaphors and track your progress!")
 
-    # Initialize SkillPlatformManager in session state if not already present
-    if 'manager' not in st.session_state:
-        st.session_state.manager = SkillPlatformManager()
-        st.session_state.manager.load_data()  # Load data on initial startup
-
-    manager = st.session_state.manager
+    manager = get_manager()
+    with manager.lock:  # Only the first session to get here loads
+        if not manager.loaded:
+            manager.load_data()  # Load data on initial startup
+    manager.report_write_error()  # Saves finish in the background, so failures surface on a later run
 
     # Sidebar for navigation
     st.sidebar.header("Actions")
@@ -331,6 +1061,10 @@ def streamlit_app():
          "Remove Skill", "Remove Category", "Export Skills", "Auto-Suggest Skills")
     )
 
+    # Edits are kept in memory until saved explicitly (or on shutdown)
+    if st.sidebar.button("Save"):
+        manager.flush()
+
     # Main content area based on selected action
     if action == "View All Skills":
         manager.display_all_skills()
@@ -347,7 +1081,7 @@ def streamlit_app():
 
     elif action == "Add Skill":
         st.header("Add New Skill to Category")
-        category_names = list(manager.categories.keys())
+        category_names = manager.category_names()
         if not category_names:
             st.warning("Please add a skill category first.")
         else:
@@ -364,11 +1098,12 @@ def streamlit_app():
                     if category:
                         try:
                             if skill_type == 'Soft Skill':
-                                skill = SoftSkill(skill_name, skill_level, skill_desc)
+                                skill = make_soft(skill_name, skill_level, skill_desc)
                             elif skill_type == 'Hard Skill':
-                                skill = HardSkill(skill_name, skill_level, skill_desc)
-                            category.add_skill(skill)
-                            manager.save_data()  # Save after adding skill
+                                skill = make_hard(skill_name, skill_level, skill_desc)
+                            with manager.lock:
+                                category.add_skill(skill)
+                                manager.mark_dirty(selected_cat)
                         except ValueError as e:
                             st.error(f"Error: {e}")
                 elif submitted and not skill_name:
@@ -376,7 +1111,7 @@ def streamlit_app():
 
     elif action == "Update Skill Level":
         st.header("Update Skill Level")
-        category_names = list(manager.categories.keys())
+        category_names = manager.category_names()
         if not category_names:
             st.warning("No categories available to update skills.")
         else:
@@ -385,7 +1120,7 @@ def streamlit_app():
 
                 # Get skills for the selected category dynamically
                 current_category = manager.get_category(selected_cat)
-                skill_names_in_cat = list(current_category.skills.keys()) if current_category else []
+                skill_names_in_cat = current_category.skill_names() if current_category else ()
 
                 if not skill_names_in_cat:
                     st.warning(f"No skills in '{selected_cat}' category.")
@@ -393,14 +1128,16 @@ def streamlit_app():
                     selected_skill = st.selectbox("Select Skill", skill_names_in_cat, key="update_skill_name")
 
                     if selected_skill:
-                        skill_obj = current_category.get_skill(selected_skill)
+                        with manager.lock:
+                            skill_obj = current_category.get_skill(selected_skill)
                         if skill_obj:
                             new_level = st.slider(f"New Level for '{selected_skill}'", 0, 100, skill_obj.level,
                                                   key="update_skill_level")
                             submitted = st.form_submit_button("Update Level")
                             if submitted:
-                                skill_obj.update_level(new_level)
-                                manager.save_data()  # Save after updating skill
+                                with manager.lock:
+                                    current_category.update_skill_level(selected_skill, new_level)
+                                    manager.mark_dirty(selected_cat)
                         else:
                             st.error("Selected skill not found (this should not happen).")
                     else:
@@ -408,7 +1145,7 @@ def streamlit_app():
 
     elif action == "Remove Skill":
         st.header("Remove Skill from Category")
-        category_names = list(manager.categories.keys())
+        category_names = manager.category_names()
         if not category_names:
             st.warning("No categories available to remove skills from.")
         else:
@@ -417,7 +1154,7 @@ def streamlit_app():
 
                 # Get skills for the selected category dynamically
                 current_category = manager.get_category(selected_cat)
-                skill_names_in_cat = list(current_category.skills.keys()) if current_category else []
+                skill_names_in_cat = current_category.skill_names() if current_category else ()
 
                 if not skill_names_in_cat:
                     st.warning(f"No skills in '{selected_cat}' category to remove.")
@@ -425,14 +1162,15 @@ def streamlit_app():
                     selected_skill = st.selectbox("Select Skill to Remove", skill_names_in_cat, key="remove_skill_name")
                     submitted = st.form_submit_button("Remove Skill")
                     if submitted and selected_skill:
-                        manager.get_category(selected_cat).remove_skill(selected_skill)
-                        manager.save_data()  # Save after removing skill
+                        with manager.lock:
+                            manager.get_category(selected_cat).remove_skill(selected_skill)
+                            manager.mark_dirty(selected_cat)
                     elif submitted and not selected_skill:
                         st.warning("Please select a skill to remove.")
 
     elif action == "Remove Category":
         st.header("Remove Skill Category")
-        category_names = list(manager.categories.keys())
+        category_names = manager.category_names()
         if not category_names:
             st.warning("No categories available to remove.")
         else:
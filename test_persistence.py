@@ -0,0 +1,303 @@
+import atexit
+import errno
+import json
+import os
+import pickle
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def make_manager(tmp_path, monkeypatch):
+    """Builds managers that read and write in a temp directory, closing them before it goes away."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("SKILLS_CACHE_KEY", "test-key")
+    managers = []
+
+    def make(data_format: str = "json") -> main.SkillPlatformManager:
+        manager = main.SkillPlatformManager()
+        atexit.unregister(manager.close)  # Closed below, while still in the temp directory
+        manager.data_format = data_format
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.close()
+
+
+def _rows(manager: main.SkillPlatformManager) -> dict:
+    return {name: category._rows() for name, category in manager.categories.items()}
+
+
+def _reload(make_manager, use_cache: bool = False, data_format: str = "json") -> main.SkillPlatformManager:
+    if not use_cache and os.path.exists("skills_data.pkl"):
+        os.remove("skills_data.pkl")
+    manager = make_manager(data_format)
+    manager.load_data()
+    return manager
+
+
+def _populate(manager: main.SkillPlatformManager):
+    for name in ("python", "Python", "index", "ç/ü", "x" * 300, "empty"):
+        manager._add_category_silent(name)
+    manager.get_category("python")._add_skill_silent(main.make_hard("debugging", 40, "pdb"))
+    manager.get_category("python")._add_skill_silent(main.make_soft("writing code", 75))
+    manager.get_category("Python")._add_skill_silent(main.make_soft("snakes", 5))
+    manager.get_category("index")._add_skill_silent(main.make_hard("lookups", 95))
+    manager.get_category("ç/ü")._add_skill_silent(main.make_soft("ünïcode", 50, "ç"))
+    manager.get_category("x" * 300)._add_skill_silent(main.make_hard("long", 10))
+
+
+@pytest.mark.parametrize("use_cache", [False, True])
+def test_save_load_round_trip(make_manager, use_cache):
+    manager = make_manager()
+    _populate(manager)
+    manager.close()
+
+    loaded = _reload(make_manager, use_cache)
+    assert _rows(loaded) == _rows(manager)
+    assert loaded.category_names() == manager.category_names()
+    assert loaded.get_category("python").get_skill("debugging").get_visual_metaphor() == \
+        "XP Tree: Young Tree (Level: 40)"
+
+
+def test_category_named_index_survives_repeated_saves(make_manager):
+    manager = make_manager()
+    manager._add_category_silent("index")
+    manager.get_category("index")._add_skill_silent(main.make_hard("a", 40))
+    manager.close()
+    manager.get_category("index")._add_skill_silent(main.make_hard("b", 41))
+    manager.mark_dirty("index")
+    manager.close()
+
+    assert _rows(_reload(make_manager)) == {"index": [("a", 40, "", 1), ("b", 41, "", 1)]}
+
+
+def test_remove_skill_and_category(make_manager):
+    manager = make_manager()
+    _populate(manager)
+    manager.close()
+    files_before = set(os.listdir("skills_data"))
+
+    manager.get_category("python")._remove_skill_silent("debugging")
+    manager.mark_dirty("python")
+    manager._remove_category_silent("Python")
+    manager.close()
+
+    assert len(files_before - set(os.listdir("skills_data"))) == 1  # The removed category's file
+    loaded = _reload(make_manager)
+    assert "Python" not in loaded.categories
+    assert loaded.get_category("python").skill_names() == ("writing code",)
+    assert _rows(loaded) == _rows(manager)
+
+
+def test_legacy_file_is_migrated(make_manager):
+    legacy = {
+        "python": {"name": "python", "skills": [
+            {"name": "debugging", "level": 40, "description": "", "type": "HardSkill"},
+            {"name": "writing code", "level": 0, "description": "", "type": "SoftSkill"},
+            {"name": "mystery", "level": 1, "description": "", "type": "UnknownSkill"},
+        ]},
+        "empty": {"name": "empty", "skills": []},
+    }
+    with open("skills_data.json", "w", encoding="utf-8") as f:
+        json.dump(legacy, f, indent=4)
+
+    manager = make_manager()
+    manager.load_data()
+    assert _rows(manager) == {"python": [("debugging", 40, "", 1), ("writing code", 0, "", 0)], "empty": []}
+    manager.close()
+
+    assert os.path.isdir("skills_data")
+    assert _rows(_reload(make_manager)) == _rows(manager)
+
+
+def test_cache_is_used_until_data_changes(make_manager):
+    manager = make_manager()
+    _populate(manager)
+    manager.close()
+    assert os.path.exists("skills_data.pkl")
+
+    from_cache = _reload(make_manager, use_cache=True)
+    assert not from_cache._cache_stale  # Loaded from the cache, nothing to rewrite
+
+    # Edit a category file behind the cache's back; the cache is now older than the data
+    path = os.path.join("skills_data", manager._category_files["Python"])
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"v": main._DATA_VERSION, "name": "Python", "rows": [["snakes", 60, "", 0]]}, f)
+    future = os.path.getmtime("skills_data.pkl") + 10
+    os.utime(path, (future, future))
+
+    from_data = _reload(make_manager, use_cache=True)
+    assert from_data._cache_stale
+    assert _rows(from_data)["Python"] == [("snakes", 60, "", 0)]
+
+
+def test_tampered_cache_is_ignored(make_manager):
+    manager = make_manager()
+    _populate(manager)
+    manager.close()
+    with open("skills_data.pkl", "r+b") as f:
+        f.seek(-1, os.SEEK_END)
+        last = f.read(1)
+        f.seek(-1, os.SEEK_END)
+        f.write(bytes([last[0] ^ 0xFF]))
+
+    loaded = _reload(make_manager, use_cache=True)
+    assert loaded._cache_stale  # Fell back to the data dir
+    assert _rows(loaded) == _rows(manager)
+
+
+def test_failed_write_drops_cache(make_manager, monkeypatch):
+    manager = make_manager()
+    manager._add_category_silent("python")
+    manager.get_category("python")._add_skill_silent(main.make_hard("debugging", 40))
+    manager.close()
+
+    manager.get_category("python")._update_level_silent("debugging", 99)
+    manager.mark_dirty("python")
+
+    def fail(path, buf):
+        raise OSError(errno.ENOSPC, "No space left on device")
+
+    monkeypatch.setattr(manager, "_write_file", fail)
+    manager.close()
+
+    assert not os.path.exists("skills_data.pkl")
+    assert _rows(_reload(make_manager, use_cache=True)) == {"python": [("debugging", 40, "", 1)]}
+
+
+def test_pickled_files_need_the_pickle_format(make_manager):
+    manager = make_manager("pickle")
+    _populate(manager)
+    manager.close()
+    assert all(not name.endswith(".json") or name == "index.json" for name in os.listdir("skills_data"))
+
+    assert _reload(make_manager).categories == {}
+    assert _rows(_reload(make_manager, data_format="pickle")) == _rows(manager)
+
+
+def test_pickled_legacy_file_is_not_unpickled(make_manager):
+    class Payload:
+        def __reduce__(self):
+            return os.mkdir, ("pwned",)
+
+    with open("skills_data.json", "wb") as f:
+        f.write(pickle.dumps({"python": Payload()}))
+
+    manager = make_manager()
+    manager.load_data()
+    assert manager.categories == {}
+    assert not os.path.exists("pwned")
+
+
+def test_switching_format_replaces_files(make_manager):
+    pytest.importorskip("msgpack")
+    manager = make_manager()
+    _populate(manager)
+    manager.close()
+
+    manager.data_format = "msgpack"
+    manager.mark_dirty("python")
+    manager.close()
+
+    names = os.listdir("skills_data")
+    assert sum(name.startswith("python-") for name in names) == 1
+    assert manager._category_files["python"].endswith(".msgpack")
+    assert _rows(_reload(make_manager)) == _rows(manager)
+
+
+def test_unreadable_category_is_kept_through_saves(make_manager):
+    manager = make_manager()
+    for name in ("a", "b"):
+        manager._add_category_silent(name)
+        manager.get_category(name)._add_skill_silent(main.make_soft(f"{name}-skill", 10))
+    manager.close()
+    path = os.path.join("skills_data", manager._category_files["b"])
+    with open(path, "rb") as f:
+        good = f.read()
+    with open(path, "wb") as f:
+        f.write(b"{not json")
+
+    damaged = _reload(make_manager)
+    assert list(damaged.categories) == ["a"]
+    assert not damaged._add_category_silent("b")[0]  # Would overwrite the unreadable file
+    damaged._add_category_silent("new")
+    damaged.close()
+    assert not os.path.exists("skills_data.pkl")  # A cache would hide "b" from the next startup
+
+    with open(path, "wb") as f:
+        f.write(good)
+    repaired = _reload(make_manager, use_cache=True)
+    assert _rows(repaired) == {"a": [("a-skill", 10, "", 0)], "new": [], "b": [("b-skill", 10, "", 0)]}
+
+
+def test_unknown_data_version_skips_only_that_category(make_manager):
+    manager = make_manager()
+    for name in ("a", "future"):
+        manager._add_category_silent(name)
+        manager.get_category(name)._add_skill_silent(main.make_hard(f"{name}-skill", 70))
+    manager.close()
+    path = os.path.join("skills_data", manager._category_files["future"])
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"v": main._DATA_VERSION + 1, "name": "future", "rows": [["x", 1, "", 0, "new field"]]}, f)
+
+    loaded = _reload(make_manager)
+    assert _rows(loaded) == {"a": [("a-skill", 70, "", 1)]}
+    assert loaded._unloaded == {"future": manager._category_files["future"]}
+
+
+def test_failed_load_blocks_saves_until_a_retry_succeeds(make_manager):
+    manager = make_manager()
+    _populate(manager)
+    manager.close()
+    index_path = os.path.join("skills_data", "index.json")
+    with open(index_path, "rb") as f:
+        good_index = f.read()
+    with open(index_path, "wb") as f:
+        f.write(b"{broken")
+
+    failed = _reload(make_manager)
+    assert not failed.loaded
+    failed._add_category_silent("new")
+    failed.close()
+    with open(index_path, "rb") as f:
+        assert f.read() == b"{broken"  # Not overwritten with just "new"
+
+    with open(index_path, "wb") as f:
+        f.write(good_index)
+    failed.load_data()  # What the next script run does while loaded is False
+    assert failed.loaded
+    assert _rows(failed) == _rows(manager)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_data_files_follow_umask_and_keep_their_mode(make_manager, monkeypatch):
+    monkeypatch.setattr(main, "_UMASK", 0o022)
+    manager = make_manager()
+    manager._add_category_silent("python")
+    manager.close()
+    index_path = os.path.join("skills_data", "index.json")
+    shard_path = os.path.join("skills_data", manager._category_files["python"])
+    assert os.stat(index_path).st_mode & 0o777 == 0o644
+    assert os.stat(shard_path).st_mode & 0o777 == 0o644
+
+    os.chmod(shard_path, 0o640)
+    manager.mark_dirty("python")
+    manager.close()
+    assert os.stat(shard_path).st_mode & 0o777 == 0o640
+
+
+def test_fractional_levels_are_truncated_on_load(make_manager):
+    legacy = {"python": {"name": "python", "skills": [
+        {"name": "debugging", "level": 40.5, "description": "", "type": "HardSkill"},
+    ]}}
+    with open("skills_data.json", "w", encoding="utf-8") as f:
+        json.dump(legacy, f)
+
+    manager = make_manager()
+    manager.load_data()
+    assert _rows(manager) == {"python": [("debugging", 40, "", 1)]}
@@ -0,0 +1,83 @@
+import pytest
+
+import main
+
+
+def test_vectorized_stages_match_bisect():
+    pytest.importorskip("numpy")
+    levels = [level % 121 - 10 for level in range(3 * main._NUMPY_MIN_LEVELS)]  # -10..110, past both ends
+    assert len(levels) >= main._NUMPY_MIN_LEVELS
+    stages = main._stages_for_levels(levels)
+    assert stages == [main._stage_for_level(level) for level in levels]
+    assert "Unknown" in stages and "Ancient Tree" in stages
+    assert main._stages_for_levels(levels[:10]) == stages[:10]  # Short inputs take the bisect path
+
+
+def _category(*names: str) -> main.SkillCategory:
+    category = main.SkillCategory("test")
+    for i, name in enumerate(names):
+        make = main.make_hard if i % 2 else main.make_soft
+        category._add_skill_silent(make(name, 10 * (i + 1), f"{name} description"))
+    return category
+
+
+def _assert_consistent(category: main.SkillCategory):
+    assert len({len(column) for column in category._columns()}) == 1
+    assert len(category._index) == len(category._names)
+    for name, row in category._index.items():
+        assert category._names[row] == name
+
+
+def test_remove_skill_moves_last_row_into_the_gap():
+    category = _category("a", "b", "c", "d")
+    assert category.skill_names() == ("a", "b", "c", "d")
+
+    assert category._remove_skill_silent("b")[0]
+    _assert_consistent(category)
+    assert category.skill_names() == ("a", "d", "c")  # Cached tuple was invalidated
+    moved = category.get_skill("d")
+    assert (moved.level, moved.description, moved.kind) == (40, "d description", main.HARD_SKILL)
+    assert moved.get_visual_metaphor() == "XP Tree: Young Tree (Level: 40)"
+
+    category._update_level_silent("d", 95)  # The moved row is still addressed by name
+    assert category.get_skill("d").level == 95
+    assert category.get_skill("c").level == 30
+
+
+def test_remove_last_and_only_skills():
+    category = _category("a", "b")
+    assert category._remove_skill_silent("b")[0]
+    _assert_consistent(category)
+    assert category.skill_names() == ("a",)
+    assert category._remove_skill_silent("a")[0]
+    _assert_consistent(category)
+    assert category.skill_names() == ()
+    assert not category._remove_skill_silent("a")[0]
+
+
+def test_readding_a_removed_skill_appends_it():
+    category = _category("a", "b", "c")
+    category._remove_skill_silent("a")
+    category._add_skill_silent(main.make_soft("a", 5))
+    _assert_consistent(category)
+    assert category.skill_names() == ("c", "b", "a")
+    assert category.get_skill("a").level == 5
+
+
+def test_progress_labels_are_precomputed_on_change():
+    category = _category("a", "b")
+    assert [row[5] for row in category._snapshot()] == ["Mana: 10%", "XP Progress: 20% (Sapling)"]
+    category._update_level_silent("b", 65)
+    assert category._snapshot()[1][3:] == ("XP Tree: Mature Tree (Level: 65)", 0.65, "XP Progress: 65% (Mature Tree)")
+
+    bulk = main.SkillCategory("bulk")
+    bulk._set_skills_bulk(["a", "b"], [10, 95], ["", ""], [0, 1], iter(["Ancient Tree"]))
+    assert [row[5] for row in bulk._snapshot()] == ["Mana: 10%", "XP Progress: 95% (Ancient Tree)"]
+
+
+@pytest.mark.parametrize("new_level", [-1, 101])
+def test_out_of_range_level_update_is_reported_not_raised(new_level):
+    category = _category("a")
+    ok, msg = category._update_level_silent("a", new_level)
+    assert not ok and "between 0 and 100" in msg
+    assert category.get_skill("a").level == 10